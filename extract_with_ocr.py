@@ -1,26 +1,127 @@
 #!/usr/bin/env python3
 """
 Optimized OCR text extraction for scanned PDFs with Apple Silicon acceleration.
-Uses PyMuPDF for PDF processing and Tesseract for OCR with parallelization.
+Uses PyMuPDF for PDF processing and Tesseract (or Apple Vision on Apple Silicon,
+EasyOCR/PaddleOCR on CUDA GPUs) for OCR with parallelization.
 python extract_with_ocr.py <filename>.pdf -o /path/to/llm.txt
 """
 import os
 import sys
 import time
+import queue
+import traceback
+import hashlib
 import argparse
+import tempfile
+import importlib.util
+import multiprocessing
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import OrderedDict
+from multiprocessing import shared_memory
 
 import fitz
 import numpy as np
 import pytesseract
+import PIL
 from PIL import Image
 
+try:
+    import resource  # Unix only, used to report worker memory use
+except ImportError:
+    resource = None
+
+try:
+    import cv2  # Optional, used for adaptive DPI selection and preprocessing
+except ImportError:
+    cv2 = None
+
+try:
+    import tesserocr  # In-process Tesseract API, avoids a subprocess per page
+except ImportError:
+    tesserocr = None
+
+try:
+    # Optional, pyobjc bindings for Apple's Neural Engine-backed Vision OCR
+    import objc
+    import Quartz
+    import Vision
+except ImportError:
+    Vision = None
+
 # Performance monitoring
 start_time = time.time()
 pages_processed = 0
 total_pages = 0
 
+# Upper bound on pages handed to a worker per task; amortizes IPC round-trips
+PAGES_PER_TASK = 8
+
+# Pages whose embedded text layer has more characters than this are not OCRed
+MIN_TEXT_LAYER_CHARS = 40
+
+# Recognized text of full-page scan images kept per worker, keyed by image xref
+IMAGE_TEXT_CACHE_SIZE = 32
+
+# Shared-memory budget per page for OCR results. Text that doesn't fit once
+# the buffer fills up is returned through the pool as a regular string.
+SHM_BYTES_PER_PAGE = 8 * 1024
+
+# OCR results are cached per PDF content hash, page, DPI, language and backend
+OCR_CACHE_DIR = Path("~/.ocr_cache").expanduser()
+
+# Tesseract language codes mapped to Vision recognition languages
+VISION_LANGUAGES = {
+    "eng": "en-US",
+    "fra": "fr-FR",
+    "deu": "de-DE",
+    "spa": "es-ES",
+    "ita": "it-IT",
+    "por": "pt-BR",
+    "chi_sim": "zh-Hans",
+    "chi_tra": "zh-Hant",
+}
+
+# Tesseract language codes mapped to EasyOCR and PaddleOCR language names
+EASYOCR_LANGUAGES = {
+    "eng": "en",
+    "fra": "fr",
+    "deu": "de",
+    "spa": "es",
+    "ita": "it",
+    "por": "pt",
+    "chi_sim": "ch_sim",
+    "chi_tra": "ch_tra",
+}
+PADDLE_LANGUAGES = {
+    "eng": "en",
+    "fra": "fr",
+    "deu": "german",
+    "spa": "es",
+    "ita": "it",
+    "por": "pt",
+    "chi_sim": "ch",
+    "chi_tra": "chinese_cht",
+}
+
+# Default text regions recognized per batch by EasyOCR/PaddleOCR. Each worker's
+# memory arena grows with the batch, so CPU workers (one per core) use 1.
+GPU_BATCH_SIZE = 16
+CPU_BATCH_SIZE = 1
+
+OCR_BACKENDS = ["auto", "tesseract", "vision", "easyocr", "paddle"]
+
+# Per-worker state, populated once by _init_worker
+_WORKER_DOC = None
+_TESS_API = None
+_RESULT_SHM = None
+_RESULT_OFFSET = None
+_CACHE_DIR = None
+_OCR_BACKEND = "tesseract"
+_OCR_READER = None
+_REC_BATCH_NUM = CPU_BATCH_SIZE
+_VERBOSE = False
+_IMAGE_TEXT_CACHE = OrderedDict()
+
 def check_hardware_capabilities():
     """Check hardware capabilities and set optimal configuration."""
     import platform
@@ -32,35 +133,378 @@ def check_hardware_capabilities():
     cpu_count = os.cpu_count()
     optimal_workers = max(1, cpu_count - 1)  # Leave one core free
     
+    # Vision runs OCR on the Neural Engine instead of the CPU
+    vision_ocr = is_apple_silicon and Vision is not None
+    
+    # Pillow-SIMD is a drop-in Pillow fork; its releases carry a ".postN" suffix
+    pillow_simd = ".post" in PIL.__version__
+    
     print(f"Hardware detection:")
     print(f"  Platform: {platform.system()} {platform.machine()}")
     print(f"  CPU cores: {cpu_count}")
     print(f"  Using workers: {optimal_workers}")
-    print(f"  Apple Silicon: {'Yes' + ' (accelerated)' if is_apple_silicon else 'No'}")
+    print(f"  Apple Silicon: {'Yes' + (' (Vision OCR)' if vision_ocr else '') if is_apple_silicon else 'No'}")
+    print(f"  Pillow: {PIL.__version__}{' (SIMD build)' if pillow_simd else ''}")
     
-    return {"is_apple_silicon": is_apple_silicon, "workers": optimal_workers}
+    return {"is_apple_silicon": is_apple_silicon, "workers": optimal_workers,
+            "pillow_simd": pillow_simd, "vision_ocr": vision_ocr}
+
+def _cuda_available(hardware_config):
+    """
+    Report whether a CUDA GPU is usable for EasyOCR/PaddleOCR, probing only
+    on first use and caching the answer in hardware_config["has_cuda"].
+    
+    Importing torch takes seconds and initializes the CUDA driver, so this is
+    only called for backends that can use the GPU, never for Tesseract or Vision.
+    """
+    if "has_cuda" not in hardware_config:
+        has_cuda = False
+        if importlib.util.find_spec("torch") is not None:
+            import torch
+            has_cuda = torch.cuda.is_available()
+        hardware_config["has_cuda"] = has_cuda
+        print(f"  CUDA GPU: {'Yes' if has_cuda else 'No'}")
+    return hardware_config["has_cuda"]
+
+def resolve_backend(backend, hardware_config):
+    """
+    Turn the requested OCR backend into one that can run on this machine.
+    
+    "auto" prefers Vision on Apple Silicon, then EasyOCR on a CUDA GPU, then
+    Tesseract. An explicitly requested backend that isn't installed falls
+    back to Tesseract.
+    """
+    available = {
+        "tesseract": True,
+        "vision": hardware_config.get("vision_ocr", False),
+        "easyocr": importlib.util.find_spec("easyocr") is not None,
+        "paddle": importlib.util.find_spec("paddleocr") is not None,
+    }
+    
+    if backend == "auto":
+        if available["vision"]:
+            return "vision"
+        if available["easyocr"] and _cuda_available(hardware_config):
+            return "easyocr"
+        return "tesseract"
+    
+    if not available[backend]:
+        print(f"OCR backend '{backend}' is not available; using tesseract.")
+        return "tesseract"
+    return backend
+
+def _pool_context(use_gpu):
+    """
+    Pick the multiprocessing start method for the OCR pool.
+    
+    Forked workers inherit the parent's already-imported fitz, NumPy, PIL and
+    OCR modules instead of re-importing them each. Fork is only used on
+    Linux: macOS system frameworks (and Vision) are not fork-safe, Windows
+    has no fork, and CUDA cannot be initialized in a forked child.
+    """
+    if sys.platform.startswith("linux") and not use_gpu:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+def _peak_rss_mb():
+    """Peak resident set size of the current process in MiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _init_worker(pdf_path, lang, shm_name, result_offset, cache_dir, backend, use_gpu,
+                 rec_batch_num, verbose):
+    """Open the PDF and OCR engine once per worker process so pages reuse them."""
+    global _WORKER_DOC, _TESS_API, _RESULT_SHM, _RESULT_OFFSET, _CACHE_DIR, _OCR_BACKEND
+    global _OCR_READER, _REC_BATCH_NUM, _VERBOSE
+    _WORKER_DOC = fitz.open(pdf_path)
+    _RESULT_SHM = shared_memory.SharedMemory(name=shm_name)
+    _RESULT_OFFSET = result_offset
+    _CACHE_DIR = cache_dir
+    _OCR_BACKEND = backend
+    _REC_BATCH_NUM = rec_batch_num
+    _VERBOSE = verbose
+    
+    # Load the language data once instead of on every page
+    if backend == "tesseract" and tesserocr is not None:
+        _TESS_API = tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM.AUTO)
+    elif backend == "easyocr":
+        import easyocr
+        languages = [EASYOCR_LANGUAGES.get(code, code) for code in lang.split("+")]
+        _OCR_READER = easyocr.Reader(languages, gpu=use_gpu, verbose=False)
+    elif backend == "paddle":
+        from paddleocr import PaddleOCR
+        code = lang.split("+")[0]
+        _OCR_READER = PaddleOCR(lang=PADDLE_LANGUAGES.get(code, code), use_angle_cls=False,
+                                use_gpu=use_gpu, rec_batch_num=rec_batch_num, show_log=False)
+    
+    if _OCR_READER is not None:
+        peak_rss = _peak_rss_mb()
+        if peak_rss is not None:
+            print(f"\n  Worker {os.getpid()}: {backend} loaded, peak RSS {peak_rss:.0f} MiB")
+
+def _ocr_vision(samples, width, height, lang):
+    """Run Apple Vision text recognition on packed 8-bit grayscale image bytes."""
+    with objc.autorelease_pool():
+        provider = Quartz.CGDataProviderCreateWithData(None, samples, len(samples), None)
+        cg_image = Quartz.CGImageCreate(
+            width, height, 8, 8, width,
+            Quartz.CGColorSpaceCreateDeviceGray(), Quartz.kCGImageAlphaNone,
+            provider, None, False, Quartz.kCGRenderingIntentDefault)
+        
+        request = Vision.VNRecognizeTextRequest.alloc().init()
+        request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelAccurate)
+        languages = [VISION_LANGUAGES[code] for code in lang.split("+") if code in VISION_LANGUAGES]
+        if languages:
+            request.setRecognitionLanguages_(languages)
+        
+        handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(cg_image, None)
+        success, error = handler.performRequests_error_([request], None)
+        if not success:
+            raise RuntimeError(f"Vision OCR failed: {error}")
+        
+        # Bounding boxes are normalized with a bottom-left origin: read top to bottom
+        observations = sorted(
+            request.results() or [],
+            key=lambda obs: (-(obs.boundingBox().origin.y + obs.boundingBox().size.height),
+                             obs.boundingBox().origin.x))
+        return "\n".join(obs.topCandidates_(1)[0].string() for obs in observations)
+
+def _pixmap_array(pix):
+    """
+    Wrap a pixmap's samples in a (height, width[, n]) uint8 array.
+    
+    The array is a view on the pixmap's own buffer (no copy), so it is only
+    valid while the pixmap is alive.
+    """
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+    arr = rows[:, :pix.width * pix.n]  # Drops row padding, if any
+    if pix.n > 1:
+        arr = arr.reshape(pix.height, pix.width, pix.n)
+    return arr
+
+def choose_page_dpi(page, max_dpi, preprocess=False):
+    """
+    Pick a render DPI for a page from the glyph sizes of a cheap 72 DPI preview.
+    
+    Pages set in large type OCR just as well at lower resolutions, which cuts
+    the pixel count (and thus rasterization and OCR time) quadratically.
+    Preprocessed (binarized) pages hold up at 200 DPI even for small text.
+    Never returns more than max_dpi.
+    """
+    preview = page.get_pixmap(colorspace=fitz.csGRAY, alpha=False)
+    arr = _pixmap_array(preview)
+    
+    # Dark glyphs become white blobs whose bounding boxes approximate glyph height
+    _, binary = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    heights = [h for h in (cv2.boundingRect(c)[3] for c in contours) if h >= 2]
+    if not heights:
+        return max_dpi
+    
+    median_height = float(np.median(heights))
+    if median_height > 25:
+        dpi = 150
+    elif median_height > 15:
+        dpi = 200
+    else:
+        dpi = 200 if preprocess else 300
+    return min(dpi, max_dpi)
+
+def hash_pdf(pdf_path):
+    """Return a short SHA-256 digest of the PDF's bytes, used as its cache key."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+def _write_cache(cache_path, text):
+    """Atomically write a page's OCR text to the cache, ignoring I/O failures."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_path.parent,
+                                         suffix=".tmp", delete=False) as f:
+            f.write(text)
+        os.replace(f.name, cache_path)
+    except OSError:
+        pass
+
+def _run_ocr(arr, lang):
+    """Recognize the text in a 2-D uint8 grayscale array with the worker's OCR backend."""
+    height, width = arr.shape
+    if _OCR_BACKEND == "vision":
+        return _ocr_vision(arr.tobytes(), width, height, lang)
+    if _OCR_BACKEND == "easyocr":
+        lines = _OCR_READER.readtext(arr, detail=0, paragraph=True, batch_size=_REC_BATCH_NUM)
+        return "\n".join(lines)
+    if _OCR_BACKEND == "paddle":
+        result = _OCR_READER.ocr(arr, cls=False)
+        return "\n".join(line[1][0] for line in (result[0] or []))
+    if _TESS_API is not None:
+        # Hand the raw buffer straight to Tesseract, no PIL round-trip
+        _TESS_API.SetImageBytes(arr.tobytes(), width, height, 1, width)
+        return _TESS_API.GetUTF8Text()
+    return pytesseract.image_to_string(Image.fromarray(arr), lang=lang)
+
+def preprocess_image(arr):
+    """
+    Clean up a grayscale page image for OCR: adaptive binarization evens out
+    uneven lighting and a small morphological close removes isolated dark
+    specks. All of it runs in vectorized OpenCV code.
+    """
+    binary = cv2.adaptiveThreshold(arr, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                   cv2.THRESH_BINARY, 31, 10)
+    return cv2.morphologyEx(binary, cv2.MORPH_CLOSE, np.ones((2, 2), np.uint8))
+
+def _full_page_image_xref(page, text):
+    """
+    Return the xref of the single image covering a page (a typical scan), or None.
+    
+    The page must have nothing else on it, since its OCR text is reused for
+    every page showing the same image: no text (text is the page's own text
+    layer), annotations, form widgets or vector drawings that could overlay it.
+    """
+    if text.strip() or page.first_annot is not None or page.first_widget is not None:
+        return None
+    
+    images = page.get_images(full=True)
+    if len(images) != 1:
+        return None
+    
+    xref = images[0][0]
+    rects = page.get_image_rects(xref)
+    page_area = abs(page.rect)
+    if len(rects) != 1 or not page_area:
+        return None
+    if abs(rects[0] & page.rect) / page_area < 0.95 or page.get_drawings():
+        return None
+    return xref
 
 def process_page(args):
     """Process a single page with OCR."""
-    page_num, pdf_path, dpi, lang = args
+    page_num, dpi, lang, adaptive_dpi, preprocess = args
+    
+    # Get the specific page from the worker's open document
+    page = _WORKER_DOC.load_page(page_num)
+    
+    # Mixed PDFs often already have a text layer for some pages; use it as-is
+    text = page.get_text("text")
+    if len(text.strip()) > MIN_TEXT_LAYER_CHARS:
+        if _VERBOSE:
+            print(f"\n  Page {page_num + 1}: using embedded text layer, OCR skipped")
+        return page_num, text
+    
+    # Reuse OCR output from an earlier run on the same PDF and settings
+    cache_path = None
+    if _CACHE_DIR is not None:
+        dpi_key = f"{'a' if adaptive_dpi else ''}{dpi}{'p' if preprocess else ''}"
+        cache_path = _CACHE_DIR / f"{page_num}_{dpi_key}_{lang}_{_OCR_BACKEND}.txt"
+        if cache_path.exists():
+            return page_num, cache_path.read_text(encoding="utf-8")
+    
+    if adaptive_dpi:
+        dpi = choose_page_dpi(page, dpi, preprocess)
     
-    # Open the PDF and get the specific page
-    doc = fitz.open(pdf_path)
-    page = doc.load_page(page_num)
+    if _VERBOSE:
+        print(f"\n  Page {page_num + 1}: running {_OCR_BACKEND} OCR at {dpi} DPI")
     
-    # Higher DPI for better OCR quality, especially for small text
-    pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
+    # Scanned PDFs often reuse the very same page image (blank or repeated
+    # pages). Recognize each such image once per worker, but only for pages
+    # that show nothing besides that image.
+    image_key = None
+    xref = _full_page_image_xref(page, text)
+    if xref is not None:
+        image_key = (xref, dpi, page.rotation, tuple(page.rect))
     
-    # Convert to PIL Image for Tesseract
-    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    if image_key in _IMAGE_TEXT_CACHE:
+        _IMAGE_TEXT_CACHE.move_to_end(image_key)
+        text = _IMAGE_TEXT_CACHE[image_key]
+    else:
+        # Higher DPI for better OCR quality, especially for small text.
+        # Render straight to 8-bit grayscale since Tesseract binarizes anyway.
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72),
+                              colorspace=fitz.csGRAY, alpha=False)
+        arr = np.ascontiguousarray(_pixmap_array(pix))
+        if preprocess:
+            arr = preprocess_image(arr)
+        text = _run_ocr(arr, lang)
+        
+        if image_key is not None:
+            _IMAGE_TEXT_CACHE[image_key] = text
+            if len(_IMAGE_TEXT_CACHE) > IMAGE_TEXT_CACHE_SIZE:
+                _IMAGE_TEXT_CACHE.popitem(last=False)
     
-    # Run OCR with specified language
-    text = pytesseract.image_to_string(img, lang=lang)
+    if cache_path is not None:
+        _write_cache(cache_path, text)
     
     return page_num, text
 
+def _store_result(page_num, text):
+    """
+    Copy a page's text into the shared result buffer.
+    
+    Returns (page_num, (offset, length)) when the text was stored, or
+    (page_num, text) when the buffer is full and it has to be pickled back.
+    """
+    data = text.encode("utf-8")
+    with _RESULT_OFFSET.get_lock():
+        offset = _RESULT_OFFSET.value
+        if offset + len(data) > _RESULT_SHM.size:
+            return page_num, text
+        _RESULT_OFFSET.value = offset + len(data)
+    _RESULT_SHM.buf[offset:offset + len(data)] = data
+    return page_num, (offset, len(data))
+
+def process_page_chunk(args):
+    """Process a run of consecutive pages in one task, reusing the worker state."""
+    pages, dpi, lang, adaptive_dpi, preprocess = args
+    return [_store_result(*process_page((page_num, dpi, lang, adaptive_dpi, preprocess)))
+            for page_num in pages]
+
+def _worker_loop(task_queue, result_queue, init_args):
+    """
+    Persistent OCR worker: set up the document and OCR engine once, then
+    drain page chunks from task_queue until a None sentinel arrives.
+    Results (or a formatted traceback) are put on result_queue.
+    
+    The Tesseract API is shut down here rather than through atexit, since
+    multiprocessing children leave via os._exit and skip atexit handlers.
+    """
+    try:
+        try:
+            _init_worker(*init_args)
+        except Exception:
+            result_queue.put(("error", traceback.format_exc()))
+            return
+        
+        while True:
+            chunk_args = task_queue.get()
+            if chunk_args is None:
+                break
+            try:
+                result_queue.put(("ok", process_page_chunk(chunk_args)))
+            except Exception:
+                result_queue.put(("error", traceback.format_exc()))
+    finally:
+        if _TESS_API is not None:
+            _TESS_API.End()
+
+def _next_result(result_queue, processes):
+    """Wait for the next worker result, failing if every worker has died."""
+    while True:
+        try:
+            return result_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                raise RuntimeError("OCR workers exited before all pages were processed")
+
 def extract_text_with_ocr(pdf_path, output_file=None, dpi=300, lang='eng', 
-                          batch_size=None, hardware_config=None):
+                          batch_size=None, hardware_config=None, adaptive_dpi=False,
+                          use_cache=True, backend="auto", rec_batch_num=None,
+                          verbose=False, preprocess=False):
     """
     Extract text from a PDF using OCR, optimized for performance.
     
@@ -71,9 +515,21 @@ def extract_text_with_ocr(pdf_path, output_file=None, dpi=300, lang='eng',
         lang: Tesseract language (default: 'eng')
         batch_size: Number of pages to process in parallel (default: auto)
         hardware_config: Hardware capabilities configuration
+        adaptive_dpi: Pick 150/200/300 DPI per page from its text size, capped
+            at dpi (default: False, requires OpenCV)
+        use_cache: Reuse and store per-page OCR results under OCR_CACHE_DIR
+            (default: True)
+        backend: OCR engine, one of OCR_BACKENDS (default: 'auto')
+        rec_batch_num: Text regions per recognition batch for EasyOCR/PaddleOCR
+            (default: 1 on CPU, GPU_BATCH_SIZE on GPU)
+        verbose: Report per-page decisions (text layer vs. OCR, DPI)
+        preprocess: Binarize and despeckle page images before OCR; with
+            adaptive_dpi, small-text pages drop to 200 DPI (default: False,
+            requires OpenCV)
     
     Returns:
-        Extracted text
+        Extracted text, or None when output_file is given (pages are then
+        streamed to the file instead of being kept in memory)
     """
     global total_pages, pages_processed
     
@@ -84,30 +540,111 @@ def extract_text_with_ocr(pdf_path, output_file=None, dpi=300, lang='eng',
     if batch_size is None:
         batch_size = hardware_config["workers"]
     
+    if adaptive_dpi and cv2 is None:
+        print("OpenCV (cv2) is not installed; adaptive DPI disabled.")
+        adaptive_dpi = False
+    if preprocess and cv2 is None:
+        print("OpenCV (cv2) is not installed; preprocessing disabled.")
+        preprocess = False
+    
+    backend = resolve_backend(backend, hardware_config)
+    
+    # GPU models are loaded once into a single process that owns the GPU
+    workers = hardware_config["workers"]
+    use_gpu = backend in ("easyocr", "paddle") and _cuda_available(hardware_config)
+    if use_gpu:
+        workers = 1
+    if rec_batch_num is None:
+        rec_batch_num = GPU_BATCH_SIZE if use_gpu else CPU_BATCH_SIZE
+    
     # Open the PDF to get page count
-    doc = fitz.open(pdf_path)
-    total_pages = len(doc)
+    with fitz.open(pdf_path) as doc:
+        total_pages = len(doc)
     
     print(f"Processing PDF: {pdf_path}")
     print(f"  Total pages: {total_pages}")
-    print(f"  DPI: {dpi}")
+    print(f"  DPI: {f'adaptive (max {dpi})' if adaptive_dpi else dpi}")
     print(f"  Language: {lang}")
+    print(f"  Preprocessing: {'On' if preprocess else 'Off'}")
+    print(f"  OCR backend: {backend}{' (GPU)' if use_gpu else ''}")
+    if backend in ("easyocr", "paddle"):
+        print(f"  Recognition batch: {rec_batch_num}")
     print(f"  Batch size: {batch_size}")
     
-    # Create process pool for parallelization
-    all_text = [""] * total_pages  # Pre-allocate result array
+    cache_dir = None
+    if use_cache:
+        cache_dir = OCR_CACHE_DIR / hash_pdf(pdf_path)
+        print(f"  Cache: {cache_dir}")
+    
+    # Split pages into chunks, keeping every worker busy on short documents
+    chunk_size = max(1, min(PAGES_PER_TASK, -(-total_pages // workers)))
+    chunks = [range(i, min(i + chunk_size, total_pages))
+              for i in range(0, total_pages, chunk_size)]
+    chunk_args = [(chunk, dpi, lang, adaptive_dpi, preprocess) for chunk in chunks]
     
-    # Prepare page arguments
-    page_args = [(i, pdf_path, dpi, lang) for i in range(total_pages)]
+    # Workers write page text into shared memory and only return offsets.
+    # Everything after creating the segment runs under the try, so any
+    # failure (an unwritable output path, a worker that won't start) still
+    # unlinks it.
+    result_shm = shared_memory.SharedMemory(create=True,
+                                            size=max(1, total_pages * SHM_BYTES_PER_PAGE))
+    out = None
+    processes = []
+    all_text = []
+    pending = {}
+    next_expected = 0
     
-    # Process pages in parallel
-    with ProcessPoolExecutor(max_workers=hardware_config["workers"]) as executor:
-        futures = {executor.submit(process_page, args): args[0] for args in page_args}
+    try:
+        mp_context = _pool_context(use_gpu)
+        result_offset = mp_context.Value('Q', 0)
         
-        for future in as_completed(futures):
-            page_num, page_text = future.result()
-            all_text[page_num] = page_text
-            pages_processed += 1
+        # Stream pages to the output file in page order as they complete; pages
+        # that finish early wait in a small reorder buffer. Without an output
+        # file the text is collected and returned instead.
+        if output_file:
+            out = open(output_file, "w", encoding="utf-8", buffering=1 << 20)
+        
+        # Feed all chunks to a fixed set of long-lived workers, followed by one
+        # stop sentinel per worker. The workers are started before anything is
+        # put on the queue: the first put() starts the queue's feeder thread,
+        # and forking a process that already runs threads can deadlock.
+        task_queue = mp_context.Queue()
+        result_queue = mp_context.Queue()
+        init_args = (pdf_path, lang, result_shm.name, result_offset, cache_dir, backend,
+                     use_gpu, rec_batch_num, verbose)
+        processes = [mp_context.Process(target=_worker_loop,
+                                        args=(task_queue, result_queue, init_args), daemon=True)
+                     for _ in range(min(workers, len(chunk_args)))]
+        for process in processes:
+            process.start()
+        for args in chunk_args:
+            task_queue.put(args)
+        for _ in processes:
+            task_queue.put(None)
+        
+        # Process pages in parallel
+        for _ in range(len(chunk_args)):
+            status, payload = _next_result(result_queue, processes)
+            if status == "error":
+                raise RuntimeError(f"OCR worker failed:\n{payload}")
+            
+            for page_num, result in payload:
+                if isinstance(result, tuple):
+                    offset, length = result
+                    result = bytes(result_shm.buf[offset:offset + length]).decode("utf-8")
+                pending[page_num] = result
+                pages_processed += 1
+            
+            # Write out every page that is now contiguous with the output so far
+            while next_expected in pending:
+                page_text = pending.pop(next_expected)
+                if out is None:
+                    all_text.append(page_text)
+                else:
+                    if next_expected:
+                        out.write("\n\n")
+                    out.write(page_text)
+                next_expected += 1
             
             # Report progress
             progress = pages_processed / total_pages * 100
@@ -118,9 +655,21 @@ def extract_text_with_ocr(pdf_path, output_file=None, dpi=300, lang='eng',
             sys.stdout.write(f"\rProgress: {progress:.1f}% | Pages: {pages_processed}/{total_pages} "
                             f"| {pages_per_sec:.2f} pages/sec | ETA: {eta:.1f}s")
             sys.stdout.flush()
+        
+        for process in processes:
+            process.join()
+    finally:
+        # Only reached with live workers if something failed above
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        result_shm.close()
+        result_shm.unlink()
+        if out is not None:
+            out.close()
     
     # Combine all text
-    full_text = "\n\n".join(all_text)
+    full_text = "\n\n".join(all_text) if out is None else None
     
     # Calculate stats
     final_time = time.time() - start_time
@@ -130,10 +679,7 @@ def extract_text_with_ocr(pdf_path, output_file=None, dpi=300, lang='eng',
     print(f"  Processed {total_pages} pages in {final_time:.2f} seconds")
     print(f"  Processing speed: {final_pages_per_sec:.2f} pages/sec")
     
-    # Save the text if an output file is specified
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_text)
         print(f"  Output saved to: {output_file}")
     
     return full_text
@@ -143,8 +689,24 @@ def main():
     parser.add_argument('pdf_path', help='Path to the PDF file')
     parser.add_argument('-o', '--output', help='Output text file (default: <pdf_name>.txt)')
     parser.add_argument('-d', '--dpi', type=int, default=300, help='DPI for image extraction (default: 300)')
+    parser.add_argument('-a', '--adaptive-dpi', action='store_true',
+                        help='Choose DPI per page from text size, up to --dpi (requires OpenCV)')
+    parser.add_argument('-p', '--preprocess', action='store_true',
+                        help='Binarize and despeckle pages before OCR; lets --adaptive-dpi '
+                             'use 200 DPI for small text (requires OpenCV)')
     parser.add_argument('-l', '--lang', default='eng', help='Tesseract language (default: eng)')
     parser.add_argument('-b', '--batch-size', type=int, help='Pages to process in parallel (default: auto)')
+    parser.add_argument('--backend', choices=OCR_BACKENDS, default='auto',
+                        help='OCR engine (default: auto picks Vision on Apple Silicon, '
+                             'EasyOCR on CUDA GPUs, otherwise Tesseract)')
+    parser.add_argument('--rec-batch-num', type=int,
+                        help='Text regions per recognition batch for easyocr/paddle; '
+                             'higher uses more memory per worker (default: 1 on CPU, '
+                             f'{GPU_BATCH_SIZE} on GPU)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Report per-page decisions (text layer vs. OCR, DPI)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Do not read or write cached OCR results in {OCR_CACHE_DIR}')
     args = parser.parse_args()
     
     # Set default output file if not specified
@@ -162,7 +724,13 @@ def main():
         args.dpi, 
         args.lang, 
         args.batch_size,
-        hardware_config
+        hardware_config,
+        args.adaptive_dpi,
+        not args.no_cache,
+        args.backend,
+        args.rec_batch_num,
+        args.verbose,
+        args.preprocess
     )
 
 if __name__ == "__main__":
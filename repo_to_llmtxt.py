@@ -1,10 +1,15 @@
 import os
+import io
 import json
+import mmap
+import codecs
 import sys
 import argparse
 import markdown
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Sequence, TextIO, Union
 
 def detect_project_type(repo_path: Path) -> Dict[str, Any]:
     """
@@ -125,26 +130,143 @@ def detect_project_type(repo_path: Path) -> Dict[str, Any]:
     }
 
 
-def find_files_by_pattern(repo_path: Path, patterns: List[str]) -> List[str]:
+# Non-code files skipped when expanding directory patterns
+SKIP_SUFFIXES = ('.pyc', '.map', '.DS_Store')
+
+# Heavy or generated directories left out of the directory structure overview
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '.next', '__pycache__', 'dist', 'build', 'target', 'venv', 'env',
+    '.venv', '.tox', '.nox', '.mypy_cache', '.pytest_cache', '.ruff_cache', '.turbo', '.nuxt',
+    '.svelte-kit', '.parcel-cache', 'coverage', 'out'
+})
+
+# Directories never expanded when a directory pattern is collected. Kept narrow on
+# purpose: names like build/, env/ or out/ can hold real source the user asked for
+SKIP_SCAN_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+
+def _scan_files(directory: str, rel_dir: str, found_files: List[str]) -> None:
+    """
+    Recursively collect files under a directory as paths relative to the
+    repository root, built by joining each name onto rel_dir (the scanned
+    directory's own relative path, '' for the root).
+    Uses os.scandir so file/dir checks come from the directory entry itself
+    instead of a separate stat call per file. Hidden files and directories,
+    and anything in SKIP_SCAN_DIRS, are skipped.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        # Unreadable or vanished directory; skip it like os.walk does
+        return
+    
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in SKIP_SCAN_DIRS:
+                continue
+            _scan_files(entry.path, os.path.join(rel_dir, entry.name), found_files)
+        elif entry.is_file() and not entry.name.endswith(SKIP_SUFFIXES):
+            found_files.append(os.path.join(rel_dir, entry.name))
+
+
+# Directory tree indentation per depth, built once
+INDENTS = tuple(' ' * 4 * level for level in range(64))
+
+
+def iter_dirs(root, skip=SKIP_DIRS):
+    """
+    Walk the directories under root depth-first, in the same order as
+    os.walk, yielding (depth, name) for each one. Only the d_type that
+    os.scandir already has is consulted, so no per-entry stat is issued, and
+    depth and name travel on the stack, so no path strings are taken apart.
+    
+    Args:
+        root: Directory to walk (not itself yielded)
+        skip: Directory names to prune
+    """
+    stack = [(root, "", 0)]
+    while stack:
+        path, name, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                subdirs = [entry for entry in it
+                           if entry.name not in skip and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        
+        # Push in reverse so the first directory listed is visited first
+        for entry in reversed(subdirs):
+            stack.append((entry.path, entry.name, depth + 1))
+        if depth > 0:
+            yield depth, name
+
+
+def _lookup_entries(repo_path: Path, patterns: List[str]) -> Dict[str, Union[os.DirEntry, Path, None]]:
+    """
+    Look up the directory entry for each pattern, listing each parent
+    directory once with os.scandir instead of stat()ing every path.
+    Patterns that share a directory (the common case) cost one listing.
+    
+    Patterns are normalized first, so 'src/' and './src' find the entry for
+    src. The repository root ('.') has no entry of its own and is handled by
+    the caller.
+    
+    Names missing from the listing fall back to an exists() check, so on
+    case-insensitive filesystems 'readme.md' still finds README.md. Only
+    misses pay for the extra stat.
+    
+    Returns:
+        Dictionary mapping each pattern to its DirEntry (or its Path when found
+        by the fallback), or None if absent
+    """
+    groups = defaultdict(list)
+    for pattern in patterns:
+        parent, name = os.path.split(os.path.normpath(pattern))
+        groups[parent].append((pattern, name))
+    
+    entries = {}
+    for parent, members in groups.items():
+        try:
+            with os.scandir(repo_path / parent) as it:
+                present = {entry.name: entry for entry in it}
+        except OSError:
+            present = {}
+        for pattern, name in members:
+            entry = present.get(name)
+            if entry is None:
+                candidate = repo_path / pattern
+                entry = candidate if candidate.exists() else None
+            entries[pattern] = entry
+    return entries
+
+
+def find_files_by_pattern(repo_path: Path, patterns: List[str], missing: Optional[List[str]] = None) -> List[str]:
     """
     Find files in the repository matching the given patterns.
     Supports directory patterns which will include all files in that directory.
+    
+    Args:
+        repo_path: Path to the repository
+        patterns: File, directory or wildcard patterns relative to repo_path
+        missing: If given, plain patterns that match nothing are appended to it
     """
     found_files = []
+    entries = _lookup_entries(repo_path, patterns)
     for pattern in patterns:
-        pattern_path = repo_path / pattern
+        entry = entries[pattern]
+        rel_dir = os.path.normpath(pattern)
         
+        # The repository root itself: add every file
+        if rel_dir == '.':
+            _scan_files(str(repo_path), '', found_files)
         # If it's a directory, add all files recursively
-        if pattern_path.is_dir():
-            for root, _, files in os.walk(pattern_path):
-                for file in files:
-                    # Skip hidden files and common non-code files
-                    if not file.startswith('.') and not file.endswith(('.pyc', '.map', '.DS_Store')):
-                        file_path = Path(root) / file
-                        rel_path = file_path.relative_to(repo_path)
-                        found_files.append(str(rel_path))
+        elif entry is not None and entry.is_dir():
+            _scan_files(os.fspath(entry), rel_dir, found_files)
         # If it's a direct file match
-        elif pattern_path.exists():
+        elif entry is not None and entry.is_file():
             found_files.append(pattern)
         # Handle wildcard patterns (basic implementation)
         elif '*' in pattern:
@@ -160,11 +282,163 @@ def find_files_by_pattern(repo_path: Path, patterns: List[str]) -> List[str]:
                     if file.is_file():
                         rel_path = file.relative_to(repo_path)
                         found_files.append(str(rel_path))
+        elif missing is not None:
+            missing.append(pattern)
     
     return found_files
 
 
-def extract_files(repo_path, target_files=None, output_file="llm.txt", markdown_file="repo_structure.md", project_title=None):
+# Fence language for each file extension; anything else uses the extension itself
+LANGUAGE_MAP = {
+    "js": "javascript",
+    "jsx": "jsx",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "py": "python",
+    "rb": "ruby",
+    "java": "java",
+    "kt": "kotlin",
+    "go": "go",
+    "rs": "rust",
+    "c": "c",
+    "cpp": "cpp",
+    "cs": "csharp",
+    "php": "php",
+    "json": "json",
+    "yml": "yaml",
+    "yaml": "yaml",
+    "md": "markdown",
+    "html": "html",
+    "css": "css",
+    "scss": "scss",
+    "sql": "sql",
+    "sh": "bash",
+    "bash": "bash",
+    "zsh": "bash",
+    "toml": "toml",
+    "xml": "xml"
+}
+
+
+# Size of the slices source files are checked in (NUL bytes are looked for in the first one)
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Files larger than this are memory-mapped and written straight from the page cache
+MMAP_THRESHOLD = 64 * 1024
+
+# Write buffer for the output files, so a multi-MB llm.txt takes a handful of write syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+# Files larger than this are kept out of the markdown file (they still go to the
+# text file in full), so a bundled or generated file cannot swamp the document
+MAX_INLINE_BYTES = 1 << 20
+
+# Written after each file's content
+TXT_FILE_FOOTER = b"\n\n"
+MD_FILE_FOOTER = b"\n```\n\n"
+
+
+def _open_output(path) -> io.TextIOWrapper:
+    """
+    Open an output file for UTF-8 text that can also take raw bytes.
+    Text writes pass straight through to the underlying binary buffer, so
+    headers written as str and file contents written as bytes via
+    .buffer.write() stay in order.
+    
+    Outputs use LF line endings on every platform: newline="\n" stops the
+    wrapper translating to CRLF on Windows, matching the file contents,
+    which are normalized to LF and bypass the wrapper.
+    """
+    return io.TextIOWrapper(open(path, "wb", buffering=OUTPUT_BUFFER_SIZE),
+                            encoding="utf-8", newline="\n", write_through=True)
+
+
+def _check_text(content) -> None:
+    """
+    Check that file content is UTF-8 text, raising ValueError if not. It is
+    decoded incrementally one slice at a time and the text is thrown away, so
+    the check never holds more than one slice of decoded text.
+    """
+    if content.find(b"\0", 0, STREAM_CHUNK_SIZE) != -1:
+        raise ValueError("file appears to be binary")
+    
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for start in range(0, len(content), STREAM_CHUNK_SIZE):
+            decoder.decode(content[start:start + STREAM_CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValueError("file is not valid UTF-8 text")
+
+
+def _open_source(full_path: str):
+    """
+    Load a source file and check it is UTF-8 text. This is the latency-bound
+    part of extracting a file, so it is what runs on the read pool.
+    
+    Files over MMAP_THRESHOLD are memory-mapped rather than read, so their
+    bytes go to the outputs straight from the page cache. CRLF and lone CR
+    line endings are converted to LF, as reading in text mode would; only
+    files that contain a CR get copied into memory for that.
+    
+    Returns:
+        Tuple of (content as bytes or mmap, or None, size in bytes, error or None).
+        Errors are returned rather than raised so the writer can report them in order.
+    """
+    try:
+        with open(full_path, "rb") as src:
+            size = os.fstat(src.fileno()).st_size
+            if size > MMAP_THRESHOLD:
+                content = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(content, "madvise"):
+                    content.madvise(mmap.MADV_SEQUENTIAL)
+            else:
+                # The file is read once front to back, so ask for aggressive readahead (Linux only)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                content = src.read()
+    except (OSError, ValueError) as e:
+        return None, 0, e
+    
+    try:
+        _check_text(content)
+        if content.find(b"\r") != -1:
+            normalized = content[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            if isinstance(content, mmap.mmap):
+                content.close()
+            content = normalized
+    except ValueError as e:
+        if isinstance(content, mmap.mmap):
+            content.close()
+        return None, size, e
+    return content, size, None
+
+
+def _prefetch(func, items, workers):
+    """
+    Yield func(item) for each item, in order. With more than one worker the
+    calls run ahead on a thread pool, at most 2 * workers results in flight so
+    the number of open files stays bounded.
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def extract_files(repo_path, target_files=None, output_file="llm.txt", markdown_file="repo_structure.md", project_title=None,
+                  read_workers=1, sections: Optional[Sequence[Callable[[TextIO], None]]] = None,
+                  max_inline_bytes: Optional[int] = MAX_INLINE_BYTES, verbose=False):
     """
     Extract content from specified files in the repository
     and create both a raw text file and a nicely formatted markdown file.
@@ -175,6 +449,15 @@ def extract_files(repo_path, target_files=None, output_file="llm.txt", markdown_
         output_file: Output file for raw text
         markdown_file: Output file for markdown
         project_title: Title of the project. If None, will auto-detect.
+        read_workers: Number of threads opening and reading files ahead of the writer.
+            Worth raising on network filesystems; 1 reads sequentially.
+        sections: Callables that each write a documentation section to the markdown
+            file after the extracted files. If None, uses the detected project's
+            architecture docs; pass an empty list to leave them out.
+        max_inline_bytes: Files larger than this get a short note in the markdown file
+            instead of their content. None embeds every file.
+        verbose: Report every extracted file as it is written. Missing files and
+            errors are always listed in the summary at the end.
     """
     # Ensure the repo path exists
     repo_path = Path(repo_path)
@@ -182,9 +465,13 @@ def extract_files(repo_path, target_files=None, output_file="llm.txt", markdown_
         print(f"Repository path {repo_path} does not exist!")
         return
     
-    # Auto-detect project type if not specified
-    if target_files is None:
-        project_config = detect_project_type(repo_path)
+    # Detect the project type once; it drives both file selection and the architecture docs
+    project_config = detect_project_type(repo_path)
+    project_type = project_config["type"]
+    
+    # Auto-detect target files if not specified
+    explicit_files = target_files is not None
+    if not explicit_files:
         target_files = project_config["files"]
         if project_title is None:
             project_title = project_config["title"]
@@ -197,225 +484,264 @@ def extract_files(repo_path, target_files=None, output_file="llm.txt", markdown_
         project_title = "Project Structure"
     
     # Expand directory patterns in target_files
-    expanded_files = find_files_by_pattern(repo_path, target_files)
+    # Files named explicitly are reported as missing instead of silently dropped
+    unmatched = [] if explicit_files else None
+    expanded_files = find_files_by_pattern(repo_path, target_files, unmatched)
+    if explicit_files:
+        expanded_files.extend(unmatched)
     expanded_files = sorted(list(set(expanded_files)))  # Remove duplicates
     
     # Open the output files
-    with open(output_file, "w", encoding="utf-8") as txt_file, \
-         open(markdown_file, "w", encoding="utf-8") as md_file:
-        
-        # Write header to markdown file
-        md_file.write(f"# {project_title}\n\n")
-        md_file.write(f"This document contains key files from the project to help understand its structure.\n\n")
+    with _open_output(output_file) as txt_file, \
+         _open_output(markdown_file) as md_file:
         
-        # Add target_files list to both files
+        # Add target_files list to both files, after the markdown header. The
+        # lines are generated straight into the outputs without an intermediate string
         txt_file.write("### KEY FILES IN PROJECT STRUCTURE ###\n\n")
-        target_files_str = "\n".join([f"- {file}" for file in expanded_files])
-        txt_file.write(f"{target_files_str}\n\n")
+        txt_file.writelines(f"- {file}\n" for file in expanded_files)
+        txt_file.write("\n")
+        
+        md_file.write(f"# {project_title}\n\n"
+                      "This document contains key files from the project to help understand its structure.\n\n"
+                      "## Key Files in Project Structure\n\n"
+                      "```\n")
+        md_file.writelines(f"- {file}\n" for file in expanded_files)
+        md_file.write("```\n\n")
         
-        md_file.write("## Key Files in Project Structure\n\n")
-        md_file.write("```\n")
-        md_file.write(target_files_str)
-        md_file.write("\n```\n\n")
+        # Problems are collected and reported after the loop, so printing
+        # does not hold up the writer
+        extracted_count = 0
+        missing_files = []
+        failed_files = []
         
-        # Look for each target file
-        for file_path in expanded_files:
-            full_path = repo_path / file_path
-            
-            if full_path.exists() and full_path.is_file():
-                # Read the file content
+        # Look for each target file. Files are loaded and checked ahead of time
+        # on the read pool, but written strictly in list order
+        # Paths are joined as plain strings rather than Path objects; os.path.join
+        # keeps Path's handling of absolute entries in the file list
+        repo_str = str(repo_path)
+        opened = _prefetch(_open_source, [os.path.join(repo_str, file_path) for file_path in expanded_files],
+                           read_workers)
+        for file_path, (content, size, error) in zip(expanded_files, opened):
+            if content is not None:
                 try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    
-                    # Write to raw txt file
-                    txt_file.write(f"### FILE: {file_path} ###\n\n")
-                    txt_file.write(content)
-                    txt_file.write("\n\n")
-                    
-                    # Write to markdown file with syntax highlighting
-                    md_file.write(f"## {file_path}\n\n")
-                    
                     # Determine the language for syntax highlighting
-                    extension = full_path.suffix.lstrip('.')
-                    language_map = {
-                        "js": "javascript",
-                        "jsx": "jsx",
-                        "ts": "typescript",
-                        "tsx": "typescript",
-                        "py": "python",
-                        "rb": "ruby",
-                        "java": "java",
-                        "kt": "kotlin",
-                        "go": "go",
-                        "rs": "rust",
-                        "c": "c",
-                        "cpp": "cpp",
-                        "cs": "csharp",
-                        "php": "php",
-                        "json": "json",
-                        "yml": "yaml",
-                        "yaml": "yaml",
-                        "md": "markdown",
-                        "html": "html",
-                        "css": "css",
-                        "scss": "scss",
-                        "sql": "sql",
-                        "sh": "bash",
-                        "bash": "bash",
-                        "zsh": "bash",
-                        "toml": "toml",
-                        "xml": "xml"
-                    }
+                    extension = os.path.splitext(file_path)[1][1:]
+                    language = LANGUAGE_MAP.get(extension, extension)
                     
-                    language = language_map.get(extension, extension)
+                    # Copy the already-checked bytes into both outputs, with no
+                    # decode/encode round-trip; the headers are encoded once and
+                    # everything for the file goes straight to the binary buffers
+                    txt_out, md_out = txt_file.buffer, md_file.buffer
+                    inline = max_inline_bytes is None or size <= max_inline_bytes
+                    try:
+                        txt_out.write(f"### FILE: {file_path} ###\n\n".encode("utf-8"))
+                        txt_out.write(content)
+                        if inline:
+                            md_out.write(f"## {file_path}\n\n```{language}\n".encode("utf-8"))
+                            md_out.write(content)
+                        else:
+                            md_out.write(f"## {file_path}\n\n*File too large to embed inline ({size // 1024} KB). "
+                                         f"See {file_path} in the repository.*\n\n".encode("utf-8"))
+                    finally:
+                        if isinstance(content, mmap.mmap):
+                            content.close()
                     
-                    md_file.write(f"```{language}\n{content}\n```\n\n")
+                    txt_out.write(TXT_FILE_FOOTER)
+                    if inline:
+                        md_out.write(MD_FILE_FOOTER)
                     
-                    print(f"✅ Extracted: {file_path}")
+                    extracted_count += 1
+                    if verbose:
+                        print(f"✅ Extracted: {file_path}")
                     
                 except Exception as e:
-                    print(f"❌ Error reading {file_path}: {e}")
-            elif not full_path.exists():
+                    failed_files.append((file_path, e))
+            elif isinstance(error, IsADirectoryError):
+                # Not a regular file, nothing to extract
+                continue
+            elif not isinstance(error, FileNotFoundError):
+                failed_files.append((file_path, error))
+            else:
                 # File not found, note this in both outputs
                 txt_file.write(f"### FILE: {file_path} - NOT FOUND ###\n\n")
-                md_file.write(f"## {file_path}\n\n")
-                md_file.write("*File not found in repository*\n\n")
-                print(f"⚠️ Not found: {file_path}")
+                md_file.write(f"## {file_path}\n\n*File not found in repository*\n\n")
+                missing_files.append(file_path)
         
-        # Generate project-specific architecture documentation if detected
-        project_type = detect_project_type(repo_path)["type"]
+        # Everything after the extracted files is composed in memory and
+        # written to the markdown file in one go
+        tail = io.StringIO()
         
-        if project_type == "monad-miniapp":
-            generate_monad_architecture_docs(md_file)
+        # Generate project-specific architecture documentation if detected
+        if sections is not None:
+            for write_section in sections:
+                write_section(tail)
+        elif project_type == "monad-miniapp":
+            generate_monad_architecture_docs(tail)
         elif project_type == "nextjs":
-            generate_nextjs_architecture_docs(md_file)
+            generate_nextjs_architecture_docs(tail)
         elif project_type == "react":
-            generate_react_architecture_docs(md_file)
+            generate_react_architecture_docs(tail)
         else:
-            generate_generic_architecture_docs(md_file, project_type)
+            generate_generic_architecture_docs(tail, project_type)
         
-        # Additionally, add directory structure to markdown file
-        md_file.write("## Directory Structure\n\n")
-        md_file.write("```\n")
+        # Additionally, add directory structure to markdown file. Only
+        # directories are listed
+        tail.write("## Directory Structure\n\n```\n")
+        for level, name in iter_dirs(str(repo_path)):
+            indent = INDENTS[level] if level < len(INDENTS) else ' ' * 4 * level
+            tail.write(f"{indent}{name}/\n")
+        tail.write("```\n")
+        md_file.write(tail.getvalue())
         
-        # Use os.walk to get a simplified directory structure
-        for root, dirs, files in os.walk(repo_path, topdown=True):
-            # Skip common directories to exclude
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '.next', '__pycache__', 'dist', 'build', 'target', 'venv', 'env']]
-            
-            level = root.replace(str(repo_path), '').count(os.sep)
-            indent = ' ' * 4 * level
-            relative_path = os.path.basename(root)
-            if level > 0:  # Skip the root directory itself
-                md_file.write(f"{indent}{relative_path}/\n")
-        
-        md_file.write("```\n")
-        
-    print(f"\nDone! Created {output_file} and {markdown_file}")
+    for file_path in missing_files:
+        print(f"⚠️ Not found: {file_path}")
+    for file_path, error in failed_files:
+        print(f"❌ Error reading {file_path}: {error}")
+    print(f"\nExtracted {extracted_count} files ({len(missing_files)} not found, {len(failed_files)} failed)")
+    print(f"Done! Created {output_file} and {markdown_file}")
+
+
+# Architecture documentation emitted after the extracted files, one write per project type
+MONAD_DOCS_TEMPLATE = """\
+## Application Architecture
+
+### Overview
+
+The Monad Mini-App Template is built with Next.js and integrates with Farcaster and wallet functionality. Here's a breakdown of how the components work together:
+
+### Component Relationships
+
+```
+app/layout.tsx                 # Root layout with providers
+  ├─ farcaster-provider.tsx   # Farcaster authentication context
+  ├─ frame-wallet-provider.tsx # Wallet connection for Frames
+  └─ app/page.tsx            # Entry point with Frame metadata
+       └─ components/pages/app.tsx # Main application component
+           └─ components/Home/* # UI components for user interaction
+               ├─ FarcasterActions.tsx # Farcaster-specific actions
+               ├─ WalletActions.tsx # Wallet connection and transactions
+               └─ User.tsx    # User profile display
+```
+
+### Data Flow
+
+1. **Authentication**: Handled by `farcaster-provider.tsx` using Farcaster authentication protocol
+2. **Context Management**: `use-miniapp-context.ts` hook provides access to authenticated user and wallet
+3. **Wallet Integration**: `frame-wallet-provider.tsx` enables connection to the user's wallet through Farcaster Frames
+4. **UI Components**: Components in the Home directory leverage the context to display user info and enable interactions
+
+## Getting Started
+
+To set up this mini-app template:
+
+1. Clone the repository
+2. Install dependencies with `yarn install`
+3. Copy `.env.example` to `.env.local` and update variables
+4. Run the development server with `yarn dev`
+5. Navigate to `http://localhost:3000` to view the app
+
+For deployment, you'll need to set up the same environment variables in your hosting provider.
+
+"""
+
+NEXTJS_DOCS_TEMPLATE = """\
+## Application Architecture
+
+### Overview
+
+This is a Next.js project that follows the App Router pattern. Here's a breakdown of the key architectural components:
+
+### Directory Structure Explained
+
+- **app/**: Contains the application routes and layouts using Next.js App Router
+- **components/**: Reusable UI components organized by feature or page
+- **lib/**: Utility functions, hooks, and configuration
+- **public/**: Static assets like images, fonts, etc.
+
+## Getting Started
+
+To run this Next.js project:
+
+1. Clone the repository
+2. Install dependencies with `npm install` or `yarn install`
+3. Run the development server with `npm run dev` or `yarn dev`
+4. Open http://localhost:3000 in your browser
+
+"""
+
+REACT_DOCS_TEMPLATE = """\
+## Application Architecture
+
+### Overview
+
+This is a React application with a standard Create React App structure. The application is organized by features with a component-based architecture.
+
+### Directory Structure Explained
+
+- **src/components/**: Reusable UI components
+- **src/hooks/**: Custom React hooks
+- **src/pages/**: Page components that represent routes
+- **src/utils/**: Utility functions and helpers
+- **public/**: Static assets and index.html
+
+## Getting Started
+
+To run this React project:
+
+1. Clone the repository
+2. Install dependencies with `npm install` or `yarn install`
+3. Start the development server with `npm start` or `yarn start`
+4. Open http://localhost:3000 in your browser
+
+"""
+
+PYTHON_DOCS_TEMPLATE = """\
+## Project Overview
+
+This is a Python project with the following structure:
+
+- **Requirements**: See requirements.txt or pyproject.toml for dependencies
+- **Project Organization**: The project follows standard Python module organization
+
+Refer to the directory structure and file contents for more details on the project organization.
+
+"""
+
+GENERIC_DOCS_TEMPLATE = """\
+## Project Overview
+
+This project contains the following key files and directories:
+
+- **Configuration Files**: Setup and environment configuration
+- **Source Code**: Core implementation files
+- **Documentation**: Usage guides and API documentation
+
+Refer to the directory structure and file contents for more details on the project organization.
+
+"""
 
 
 def generate_monad_architecture_docs(md_file):
     """Generate architecture documentation specific to Monad Mini-Apps."""
-    md_file.write("## Application Architecture\n\n")
-    md_file.write("### Overview\n\n")
-    md_file.write("The Monad Mini-App Template is built with Next.js and integrates with Farcaster and wallet functionality. " +
-                 "Here's a breakdown of how the components work together:\n\n")
-    
-    # Component relationships
-    md_file.write("### Component Relationships\n\n")
-    md_file.write("```\n")
-    md_file.write("app/layout.tsx                 # Root layout with providers\n")
-    md_file.write("  ├─ farcaster-provider.tsx   # Farcaster authentication context\n")
-    md_file.write("  ├─ frame-wallet-provider.tsx # Wallet connection for Frames\n")
-    md_file.write("  └─ app/page.tsx            # Entry point with Frame metadata\n")
-    md_file.write("       └─ components/pages/app.tsx # Main application component\n")
-    md_file.write("           └─ components/Home/* # UI components for user interaction\n")
-    md_file.write("               ├─ FarcasterActions.tsx # Farcaster-specific actions\n")
-    md_file.write("               ├─ WalletActions.tsx # Wallet connection and transactions\n")
-    md_file.write("               └─ User.tsx    # User profile display\n")
-    md_file.write("```\n\n")
-    
-    # Data flow explanation
-    md_file.write("### Data Flow\n\n")
-    md_file.write("1. **Authentication**: Handled by `farcaster-provider.tsx` using Farcaster authentication protocol\n")
-    md_file.write("2. **Context Management**: `use-miniapp-context.ts` hook provides access to authenticated user and wallet\n")
-    md_file.write("3. **Wallet Integration**: `frame-wallet-provider.tsx` enables connection to the user's wallet through Farcaster Frames\n")
-    md_file.write("4. **UI Components**: Components in the Home directory leverage the context to display user info and enable interactions\n\n")
-    
-    # Getting Started guide
-    md_file.write("## Getting Started\n\n")
-    md_file.write("To set up this mini-app template:\n\n")
-    md_file.write("1. Clone the repository\n")
-    md_file.write("2. Install dependencies with `yarn install`\n")
-    md_file.write("3. Copy `.env.example` to `.env.local` and update variables\n")
-    md_file.write("4. Run the development server with `yarn dev`\n")
-    md_file.write("5. Navigate to `http://localhost:3000` to view the app\n\n")
-    md_file.write("For deployment, you'll need to set up the same environment variables in your hosting provider.\n\n")
+    md_file.write(MONAD_DOCS_TEMPLATE)
 
 
 def generate_nextjs_architecture_docs(md_file):
     """Generate architecture documentation specific to Next.js projects."""
-    md_file.write("## Application Architecture\n\n")
-    md_file.write("### Overview\n\n")
-    md_file.write("This is a Next.js project that follows the App Router pattern. " +
-                 "Here's a breakdown of the key architectural components:\n\n")
-    
-    # Component relationships
-    md_file.write("### Directory Structure Explained\n\n")
-    md_file.write("- **app/**: Contains the application routes and layouts using Next.js App Router\n")
-    md_file.write("- **components/**: Reusable UI components organized by feature or page\n")
-    md_file.write("- **lib/**: Utility functions, hooks, and configuration\n")
-    md_file.write("- **public/**: Static assets like images, fonts, etc.\n\n")
-    
-    # Getting Started guide
-    md_file.write("## Getting Started\n\n")
-    md_file.write("To run this Next.js project:\n\n")
-    md_file.write("1. Clone the repository\n")
-    md_file.write("2. Install dependencies with `npm install` or `yarn install`\n")
-    md_file.write("3. Run the development server with `npm run dev` or `yarn dev`\n")
-    md_file.write("4. Open http://localhost:3000 in your browser\n\n")
+    md_file.write(NEXTJS_DOCS_TEMPLATE)
 
 
 def generate_react_architecture_docs(md_file):
     """Generate architecture documentation specific to React projects."""
-    md_file.write("## Application Architecture\n\n")
-    md_file.write("### Overview\n\n")
-    md_file.write("This is a React application with a standard Create React App structure. " +
-                 "The application is organized by features with a component-based architecture.\n\n")
-    
-    # Directory structure explanation
-    md_file.write("### Directory Structure Explained\n\n")
-    md_file.write("- **src/components/**: Reusable UI components\n")
-    md_file.write("- **src/hooks/**: Custom React hooks\n")
-    md_file.write("- **src/pages/**: Page components that represent routes\n")
-    md_file.write("- **src/utils/**: Utility functions and helpers\n")
-    md_file.write("- **public/**: Static assets and index.html\n\n")
-    
-    # Getting Started guide
-    md_file.write("## Getting Started\n\n")
-    md_file.write("To run this React project:\n\n")
-    md_file.write("1. Clone the repository\n")
-    md_file.write("2. Install dependencies with `npm install` or `yarn install`\n")
-    md_file.write("3. Start the development server with `npm start` or `yarn start`\n")
-    md_file.write("4. Open http://localhost:3000 in your browser\n\n")
+    md_file.write(REACT_DOCS_TEMPLATE)
 
 
 def generate_generic_architecture_docs(md_file, project_type):
     """Generate generic architecture documentation for other project types."""
-    md_file.write("## Project Overview\n\n")
-    
     if project_type == "python":
-        md_file.write("This is a Python project with the following structure:\n\n")
-        md_file.write("- **Requirements**: See requirements.txt or pyproject.toml for dependencies\n")
-        md_file.write("- **Project Organization**: The project follows standard Python module organization\n")
+        md_file.write(PYTHON_DOCS_TEMPLATE)
     else:
-        md_file.write("This project contains the following key files and directories:\n\n")
-        md_file.write("- **Configuration Files**: Setup and environment configuration\n")
-        md_file.write("- **Source Code**: Core implementation files\n")
-        md_file.write("- **Documentation**: Usage guides and API documentation\n")
-    
-    md_file.write("\nRefer to the directory structure and file contents for more details on the project organization.\n\n")
+        md_file.write(GENERIC_DOCS_TEMPLATE)
 
 
 def main():
@@ -437,6 +763,17 @@ def main():
     parser.add_argument(
         "-t", "--title", help="Project title to use in documentation"
     )
+    parser.add_argument(
+        "--max-inline-bytes", type=int, default=MAX_INLINE_BYTES,
+        help=f"Largest file embedded in the markdown output (default: {MAX_INLINE_BYTES}); 0 for no limit"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Report every extracted file"
+    )
+    parser.add_argument(
+        "-j", "--read-workers", type=int, default=1,
+        help="Threads reading files ahead of the writer (default: 1); raise on network filesystems"
+    )
     
     args = parser.parse_args()
     
@@ -462,7 +799,10 @@ def main():
         target_files=target_files,
         output_file=args.output,
         markdown_file=args.markdown,
-        project_title=args.title
+        project_title=args.title,
+        read_workers=args.read_workers,
+        max_inline_bytes=args.max_inline_bytes or None,
+        verbose=args.verbose
     )
 
 